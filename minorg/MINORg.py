@@ -2313,11 +2313,12 @@ class MINORg (PathHandler):
             self.logfile.warning(f"Ignoring unset check: {descr}")
             # warnings.warn(f"Ignoring unset check: {descr}")
             return
+        ## stop at first unset status instead of collecting all statuses
         if type == "hit":
-            check_values = set(x.check(check_name) for x in self.grna_hits.flatten_hits())
+            status_unknown = any(x.check(check_name) is None for x in self.grna_hits.flatten_hits())
         else:
-            check_values = set(x.check(check_name) for x in self.grna_hits.flatten_gRNAseqs())
-        if None in check_values:
+            status_unknown = any(x.check(check_name) is None for x in self.grna_hits.flatten_gRNAseqs())
+        if status_unknown:
             # warings.warn(f"The {descr} status of at least one gRNA {type} is not known.")
             self.logfile.warning(f"The {descr} status of at least one gRNA {type} is not known.")
             if self.accept_invalid:
@@ -2358,7 +2359,7 @@ class MINORg (PathHandler):
                                 " or use self.grna() to generate gRNA.") )
         if sets is None: sets = self.sets
         ## assume all targets in self.grna_hits are to be, well, targeted
-        targets = set(hit.target_id for hit in self.grna_hits.flatten_hits())
+        targets = self.grna_hits.target_ids
         ## set exclude check
         self.filter_exclude()
         ## check if statuses has been set. If not, warn user.
@@ -2386,9 +2387,8 @@ class MINORg (PathHandler):
                                                      nonstandard_checks))))
         ## remove sequences not included in fasta file from grna_hits if fasta file provided
         if fasta:
-            grna_hits.remove_seqs(*[seq for seq in grna_hits.seqs() if
-                                    str(seq).upper() not in map(lambda x: str(x).upper(),
-                                                                fasta_to_dict(fasta).values())])
+            fasta_seqs = set(str(seq).upper() for seq in fasta_to_dict(fasta).values())
+            grna_hits.remove_seqs(*[seq for seq in grna_hits.seqs if str(seq).upper() not in fasta_seqs])
             grna_hits.rename_seqs(fasta)
         ## warn user if desired number of sets cannot be returned
         if len(grna_hits) < sets:
@@ -2396,17 +2396,22 @@ class MINORg (PathHandler):
             self.logfile.warning(f"The gRNA sequences cannot cover all target sequences the desired number of times ({len(grna_hits)} valid gRNA, {sets} set(s) requested).\n")
         ## start generating sets
         grna_sets = []
-        grna_hits_for_setcover = copy.deepcopy(grna_hits)
+        ## set cover only removes seqs from grna_hits_for_setcover, so gRNASeq and gRNAHit objects can be shared
+        ## - when only one set is requested, nothing is removed and grna_hits can be used as is
+        grna_hits_for_setcover = grna_hits if sets == 1 else grna_hits.copy(deep = False)
         ## for tie breaker functions:
         ## - cov: dictionary of {'<gRNA seq>': [<gRNAHit items>]} for unselected gRNA
         ## - all_cov: dictionary of {'<gRNA seq>': [<gRNAHit items>]} for all gRNA
         ## - covered: set of {<IDs of targets covered by already chosen gRNA>}
         if self.prioritise_nr: ## tie break with non-redundancy in coverage
-            tie_breaker = lambda cov, all_cov, covered: tuple(all_best_pos(all_best_nr(cov, all_cov, covered),
-                                                                           all_cov, covered).items())[0]
+            tie_breaker = lambda cov, all_cov, covered: next(iter(all_best_pos(all_best_nr(cov, all_cov, covered),
+                                                                               all_cov, covered).items()))
         else: ## tie break with pos (favour 5')
-            tie_breaker = lambda cov, all_cov, covered: tuple(all_best_nr(all_best_pos(cov, all_cov, covered),
-                                                                          all_cov, covered).items())[0]
+            tie_breaker = lambda cov, all_cov, covered: next(iter(all_best_nr(all_best_pos(cov, all_cov, covered),
+                                                                              all_cov, covered).items()))
+        ## note: sets are generated sequentially as each set is solved using only the gRNA left over
+        ##  from previous sets. Solving sets in parallel on disjoint subsets of gRNA would yield
+        ##  different (and likely larger) sets than this greedy sequence.
         while len(grna_sets) < sets:
             ## get a (minimum) set of gRNA sequences
             seq_set = get_minimum_set(grna_hits_for_setcover, set_num = len(grna_sets) + 1,
@@ -2415,7 +2420,8 @@ class MINORg (PathHandler):
             ## if valid set returned
             if seq_set:
                 grna_sets.append(seq_set) ## add to existing list of sets
-                grna_hits_for_setcover.remove_seqs(seq_set) ## remove seqs in seq_set so they're not repeated
+                if len(grna_sets) < sets: ## remove seqs in seq_set so they're not repeated in subsequent sets
+                    grna_hits_for_setcover.remove_seqs(seq_set)
             else:
                 # warnings.warn(f"The gRNA sequences cannot cover all target sequences the desired number of times ({sets}). (Failed at set {len(grna_sets) + 1} of {sets})\n")
                 self.logfile.warning(f"The gRNA sequences cannot cover all target sequences the desired number of times ({sets}). (Failed at set {len(grna_sets) + 1} of {sets})\n")
@@ -313,6 +313,9 @@ class gRNAHits:
     Attributes:
         _gRNAseqs (dict): stores gRNASeq objects by sequence (format: {'<seq>': <gRNASeq object>})
         _hits (dict): stores gRNAHit objects by sequence (format: {'<seq>': [<gRNAHit objects>]})
+        _target_ids (frozenset): cached set of IDs of targets hit by gRNA, or None if not yet computed
+        _upper_seqs (dict): cached uppercase gRNA sequences (format: {'<seq>': '<uppercase seq>'}),
+            or None if not yet computed
     """
     ## seqs are stored in uppercase
     def __init__(self, d = None, gRNA_seqs = None, gRNA_hits = None):
@@ -327,6 +330,8 @@ class gRNAHits:
         """
         self._gRNAseqs = {} if gRNA_seqs is None else gRNA_seqs ## dictionary of {seq: <gRNASeq obj>}
         self._hits = {} if gRNA_hits is None else gRNA_hits ## dictionary of {seq: [list of <gRNAHit obj>]}
+        self._target_ids = None ## reset by modifiers, see self.target_ids
+        self._upper_seqs = None ## reset by modifiers, see self.upper_seqs
         if d:
             self.parse_from_dict(d)
     def __repr__(self): return f"gRNAHits(gRNA = {len(self)})"
@@ -367,6 +372,32 @@ class gRNAHits:
         :type: list of str
         """
         return list(set(itertools.chain(*[grna_hit.check_names for grna_hit in self.flatten_hits()])))
+    @property
+    def target_ids(self) -> frozenset:
+        """
+        Set of IDs of targets hit by gRNA.
+        
+        Computed on first access and cached until gRNA or hits are added or removed
+        using this object's methods.
+        
+        :type: frozenset of str
+        """
+        if self._target_ids is None:
+            self._target_ids = frozenset(hit.target_id for hit in self.flatten_hits())
+        return self._target_ids
+    @property
+    def upper_seqs(self) -> dict:
+        """
+        Uppercase gRNA sequences, for case-insensitive comparison.
+        
+        Computed on first access and cached until gRNA are added or removed
+        using this object's methods.
+        
+        :type: dict of {'<seq>': '<uppercase seq>'}
+        """
+        if self._upper_seqs is None:
+            self._upper_seqs = {seq: str(seq).upper() for seq in self.hits}
+        return self._upper_seqs
     def update_records(self) -> None: ## update dictionaries to remove any discrepancies
         """
         Remove gRNASeq objects from :attr:`~minorg.grna.gRNAHits._gRNAseqs` 
@@ -376,9 +407,17 @@ class gRNAHits:
         """
         self._gRNAseqs = {k: v for k, v in self.gRNAseqs if k in self.hits}
         self._hits = {k: v for k, v in self.hits if k in self.gRNAseqs}
-    def copy(self) -> 'gRNAHits':
+        self._target_ids = None
+        self._upper_seqs = None
+    def copy(self, deep = True) -> 'gRNAHits':
         """
-        Deepcopy self to new :class:`~minorg.grna.gRNAHits` object.
+        Copy self to new :class:`~minorg.grna.gRNAHits` object.
+        
+        Arguments:
+            deep (bool): deepcopy gRNASeq and gRNAHit objects.
+                If False, only the dictionaries are copied and gRNASeq and gRNAHit objects
+                are shared with self, which is sufficient if the new object will only
+                be used to add or remove sequences.
         
         Returns
         -------
@@ -386,8 +425,12 @@ class gRNAHits:
         """
         from copy import deepcopy
         new_obj = gRNAHits()
-        new_obj._gRNAseqs = deepcopy(self.gRNAseqs)
-        new_obj._hits = deepcopy(self.hits)
+        if deep:
+            new_obj._gRNAseqs = deepcopy(self.gRNAseqs)
+            new_obj._hits = deepcopy(self.hits)
+        else:
+            new_obj._gRNAseqs = dict(self.gRNAseqs)
+            new_obj._hits = {seq: list(hits) for seq, hits in self.hits.items()}
         return new_obj
     ################
     ##  BOOLEANS  ##
@@ -486,6 +529,8 @@ class gRNAHits:
         from copy import deepcopy
         self._gRNAseqs = {str(seq).upper(): gRNASeq(seq) for seq in d.keys()}
         self._hits = deepcopy(d)
+        self._target_ids = None
+        self._upper_seqs = None
         check_names = set()
         for hit in self.flatten_hits():
             check_names |= set(hit.check_names)
@@ -587,6 +632,8 @@ class gRNAHits:
         """
         self.add_seq(seq)
         self._hits[str(seq)] = self.get_hits(seq) + [gRNA_hit]
+        self._target_ids = None
+        self._upper_seqs = None
     def add_seq(self, seq) -> None:
         """
         Add gRNA sequence if it doesn't already in self._gRNAseqs 
@@ -597,6 +644,8 @@ class gRNAHits:
         """
         if not str(seq) in self.gRNAseqs: self._gRNAseqs[str(seq)] = gRNASeq(seq)
         if not str(seq) in self.hits: self._hits[str(seq)] = []
+        self._target_ids = None
+        self._upper_seqs = None
     def remove_seqs(self, *seqs) -> None:
         """
         Remove gRNA sequence and associated hits.
@@ -604,11 +653,13 @@ class gRNAHits:
         Arguments:
             *seqs (str or Bio.Seq.Seq): gRNA sequence to remove
         """
-        if seqs and type(seqs[0]) in (list, tuple, set):
+        if seqs and type(seqs[0]) in (list, tuple, set, frozenset):
             seqs = list(itertools.chain(*seqs))
         for seq in seqs:
             if str(seq) in self.gRNAseqs: del self._gRNAseqs[str(seq)]
             if str(seq) in self.hits: del self._hits[str(seq)]
+        self._target_ids = None
+        self._upper_seqs = None
         return
     ###############
     ##  SETTERS  ##
@@ -814,29 +865,33 @@ class gRNAHits:
             # check_names = list(set(itertools.chain(*[hit.check_names for hit in self.flatten_hits()])))
         else:
             raise Exception("Either *check_names OR all_checks is required.")
+        ## get valid fields (each check requires a pass through all hits, so only do this once)
+        if report_invalid_field or not quiet or accept_invalid_field:
+            valid_check_names = [check_name for check_name in check_names if self.valid_hit_check(check_name)]
         ## warn about any invalid fields
-        if ( (report_invalid_field or not quiet) and
-             (not all(self.valid_hit_check(check_name) for check_name in check_names)) ):
+        if ( (report_invalid_field or not quiet) and len(valid_check_names) < len(check_names) ):
             warnings.warn( ("The following hit check(s) have not been set: " +
                             ','.join([check_name for check_name in check_names
-                                      if not self.valid_hit_check(check_name)])),
+                                      if check_name not in valid_check_names])),
                            MINORgWarning)
         ## remove any invalid fields
         if accept_invalid_field:
-            check_names = [check_name for check_name in check_names if self.valid_hit_check(check_name)]
+            check_names = valid_check_names
         if not check_names:
             if not quiet:
                 print("No valid hit check names remaining. Returning new gRNAHits object with all hits.")
             filtered_hits = {seq: hits for seq, hits in self.hits.items()}
         else:
-            filtered_hits = {seq: [hit for hit in hits
-                                   if ( (accept_invalid and
-                                         hit.some_valid_checks_passed(*check_names))
-                                        or ( (not accept_invalid) and
-                                             hit.some_checks_passed(*check_names)) )]
-                             for seq, hits in self.hits.items()}
-            if exclude_empty_seqs:
-                filtered_hits = {seq: hits for seq, hits in filtered_hits.items() if hits}
+            ## filter hits and (if exclude_empty_seqs) seqs in a single pass
+            filtered_hits = {}
+            for seq, hits in self.hits.items():
+                passed_hits = [hit for hit in hits
+                               if ( (accept_invalid and
+                                     hit.some_valid_checks_passed(*check_names))
+                                    or ( (not accept_invalid) and
+                                         hit.some_checks_passed(*check_names)) )]
+                if passed_hits or not exclude_empty_seqs:
+                    filtered_hits[seq] = passed_hits
         filtered_seqs = {seq: self.get_gRNAseq_by_seq(seq) for seq in filtered_hits.keys()}
         output = gRNAHits(gRNA_seqs = filtered_seqs, gRNA_hits = filtered_hits)
         return output
@@ -886,16 +941,18 @@ class gRNAHits:
             check_names = list(set(itertools.chain(*[seq.check_names for seq in self.flatten_gRNAseqs()])))
         else:
             raise Exception("Either *check_names OR all_checks is required.")
+        ## get valid fields (each check requires a pass through all sequences, so only do this once)
+        if report_invalid_field or not quiet or accept_invalid_field:
+            valid_check_names = [check_name for check_name in check_names if self.valid_seq_check(check_name)]
         ## warn about any invalid fields
-        if ( (report_invalid_field or not quiet) and
-             (not all(self.valid_seq_check(check_name) for check_name in check_names)) ):
+        if ( (report_invalid_field or not quiet) and len(valid_check_names) < len(check_names) ):
             warnings.warn( ("The following seq check(s) have not been set: " +
                             ','.join([check_name for check_name in check_names
-                                      if not self.valid_seq_check(check_name)])),
+                                      if check_name not in valid_check_names])),
                            MINORgWarning)
         ## remove any invalid fields
         if accept_invalid_field:
-            check_names = [check_name for check_name in check_names if self.valid_seq_check(check_name)]
+            check_names = valid_check_names
         if not check_names:
             if not quiet:
                 print("No valid seq check names remaining. Returning new gRNAHits object with all sequences.")
@@ -1079,6 +1136,7 @@ class gRNAHit(CheckObj):
         _range (tuple): position of gRNA in target
         _strand (str): strand of gRNA in target
         _hit_id: unique hit identifier
+        _proximity (tuple): cached (<target sense>, <distance to 5' end>), see self.proximity
     """
     def __init__(self, target, start, end, strand, hit_id):
         """
@@ -1099,6 +1157,7 @@ class gRNAHit(CheckObj):
         # self._seq_strand = '' # stores _target direction relative to original sequence from which _target was derived
         # self._parent_sense = None ## - if original (parent) sequence from which _target was derived is on antisense strand, + if _target is on sense strand
         self._hit_id = hit_id
+        self._proximity = None
     @property
     def target(self) -> 'Target': return self._target
     @property
@@ -1106,19 +1165,34 @@ class gRNAHit(CheckObj):
     @property
     def end(self) -> int: return self._range[1]
     @property
-    def target_id(self) -> str: return self.target.id
+    def target_id(self) -> str: return self._target.id
     @property
     def strand(self) -> str: return self._strand
     @property
     def hit_id(self): return self._hit_id
     @property
-    def range(self) -> tuple: return tuple(self._range)
+    def range(self) -> tuple: return self._range ## already a tuple, no need to copy
     @property
     def reverse_range(self) -> tuple: return (self.target_len - self.end, self.target_len - self.start)
     @property
-    def target_len(self) -> int: return len(self.target)
+    def target_len(self) -> int: return len(self._target)
+    @property
+    def target_strand(self) -> str: return self._target.strand
     @property
-    def target_strand(self) -> str: return self.target.strand
+    def proximity(self) -> int:
+        """
+        Distance of gRNA hit from 5' end of target.
+        
+        Distance is measured from the end of the target if the target is antisense,
+        else from the start of the target.
+        Cached until the target's sense changes.
+        
+        :type: int
+        """
+        sense = self._target.sense
+        if self._proximity is None or self._proximity[0] != sense:
+            self._proximity = (sense, (len(self._target) - self._range[1]) if sense == '-' else self._range[0])
+        return self._proximity[1]
     # def set_target_strand(self, strand): self._target_strand = strand
     def set_parent_sense(self, strand) -> None:
         self.target.set_sense_by_parent(strand)
@@ -1,12 +1,17 @@
 import os
 import re
 import sys
+import heapq
+import functools
 import itertools
+from operator import attrgetter
+from collections import Counter, defaultdict
 from Bio.Seq import Seq
 
 from minorg.functions import splitlines
 from minorg.fasta import fasta_to_dict, dict_to_fasta
 
+from minorg import MINORgError
 from minorg.grna import gRNAHits
 
 # sys.path.append("/mnt/chaelab/rachelle/src")
@@ -42,15 +47,17 @@ def all_best_nr(potential_coverage, all_coverage, covered):
         Of {'<gRNA seq>': [<list of gRNAHit obj>]} subset of 'potential_coverage'
         with equivalent non-redundancy
     """
-    ## get redundancy count
-    potential_redundancy = {grna_seq: len(set(hit.target_id for hit in hits
-                                              if hit.target_id in covered))
-                            for grna_seq, hits in all_coverage.items()
-                            if grna_seq in potential_coverage}
-    best_redundancy = min(potential_redundancy.values())
-    return {grna_seq: potential_coverage[grna_seq]
-            for grna_seq, redundancy in potential_redundancy.items()
-            if redundancy == best_redundancy}
+    ## get redundancy count and collect gRNA with lowest redundancy in a single pass
+    best_redundancy = None
+    best_coverage = {}
+    for grna_seq, hits in potential_coverage.items():
+        redundancy = len(covered.intersection(hit.target_id for hit in all_coverage[grna_seq]))
+        if best_redundancy is None or redundancy < best_redundancy:
+            best_redundancy = redundancy
+            best_coverage = {grna_seq: hits}
+        elif redundancy == best_redundancy:
+            best_coverage[grna_seq] = hits
+    return best_coverage
 
 def all_best_pos(potential_coverage, all_coverage, covered):
     """
@@ -76,16 +83,17 @@ def all_best_pos(potential_coverage, all_coverage, covered):
         Of {'<gRNA seq>': [<list of gRNAHit obj>]} subset of 'potential_coverage'
         with equivalent closeness to 5'
     """
-    ## get closeness to 5'
-    proximity = {grna_seq: sum((hit.target_len - hit.range[1] if
-                                hit.target.sense == '-' else
-                                hit.range[0])
-                               for hit in hits)/len(hits)
-                 for grna_seq, hits in potential_coverage.items()}
-    best_proximity = min(proximity.values())
-    return {grna_seq: potential_coverage[grna_seq]
-            for grna_seq, prox in proximity.items()
-            if prox == best_proximity}
+    ## get closeness to 5' and collect gRNA with best closeness in a single pass
+    best_proximity = None
+    best_coverage = {}
+    for grna_seq, hits in potential_coverage.items():
+        prox = sum(hit.proximity for hit in hits)/len(hits)
+        if best_proximity is None or prox < best_proximity:
+            best_proximity = prox
+            best_coverage = {grna_seq: hits}
+        elif prox == best_proximity:
+            best_coverage[grna_seq] = hits
+    return best_coverage
 
 def tie_break_first(cov, all_cov, coverage):
     """
@@ -110,7 +118,7 @@ def tie_break_first(cov, all_cov, coverage):
     list
         Of gRNAHit objects (for as yet uncovered targets) associated with the above gRNA sequence
     """
-    return tuple(cov.items())[0]
+    return next(iter(cov.items()))
     
 
 # ## get_minimum_sets_and_write, except instead of accepting gRNA_dict it accepts 'mapping' file and parses that into a gRNAHits object
@@ -206,13 +214,18 @@ def get_minimum_set(gRNA_hits, manual_check = True, exclude_seqs = set(), target
         tie_breaker (func): tie-breaker function.
             Takes (1) 'gRNA_coverage' filtered for unselected gRNA seq,
             (2) unmodified 'gRNA_coverage',
-            (3) list of IDs of targets covered by already selected gRNA
+            (3) list of IDs of targets covered by already selected gRNA.
+            When a gRNA is rejected during manual check, set cover resumes from the gRNA selected
+            before it instead of starting over. This gives the same set as starting over only if
+            the tie breaker's choice does not depend on which other tied gRNA are present
+            (true of :func:`~minorg.minimum_set.all_best_pos`, :func:`~minorg.minimum_set.all_best_nr`,
+            and :func:`~minorg.minimum_set.tie_break_first`, and combinations of them).
         impossible_set_message (str): message to print when gRNA cannot cover all targets
         suppress_warning (bool): suppress printing of warning when gRNA cannot cover all targets
     
     Returns
     -------
-    list
+    frozenset
         Minimum set of gRNA sequences (str)
     """
     ## tie breakers should return 2 values: <gRNASeq>, [<gRNAHits>]
@@ -222,19 +235,28 @@ def get_minimum_set(gRNA_hits, manual_check = True, exclude_seqs = set(), target
         #                                                           z.target.sense == '-' else
         #                                                           z.range[0])
         #                                                          for z in y[1])/len(y[1]))
-        tie_breaker = lambda *args: all_best_pos(*args).items()[0]
+        tie_breaker = lambda *args: next(iter(all_best_pos(*args).items()))
+    ## set cover solutions by (uppercase) excluded seqs, so that invalid user input doesn't trigger re-solving
+    solutions = {}
+    ## order of selection of gRNA seqs by last set_cover run, so that set_cover can resume from
+    ##  just before the first user-excluded gRNA seq was selected instead of starting over
+    history = []
     while True:
         ## solve set_cover
         ## note: If antisense, tie break by minimum -end. Else, tie break by minimum start.
         ## note: tie-breaker uses AVERAGE distance of hits (to inferred N-terminus)
-        seq_set = set_cover(gRNA_hits, (targets if targets is not None else
-                                        set(hit.target_id for hit in gRNA_hits.flatten_hits())),
-                            algorithm = sc_algorithm, exclude_seqs = exclude_seqs,
-                            id_key = lambda x: x.target_id,
-                            tie_breaker = tie_breaker,
-                            suppress_warning = suppress_warning)
+        exclude_key = frozenset(str(s).upper() for s in exclude_seqs)
+        if exclude_key not in solutions:
+            solutions[exclude_key] = set_cover(gRNA_hits, (targets if targets is not None else
+                                                           gRNA_hits.target_ids),
+                                               algorithm = sc_algorithm, exclude_seqs = exclude_key,
+                                               id_key = attrgetter("target_id"),
+                                               tie_breaker = tie_breaker,
+                                               suppress_warning = suppress_warning,
+                                               history = history)
+        seq_set = solutions[exclude_key]
         ## if empty set, print message and break out of loop to exit and return the empty set
-        if set(seq_set) == set():
+        if not seq_set:
             print(impossible_set_message)
             break
         ## if valid set AND manual check NOT requested, break out of loop to exit and return the valid set
@@ -242,7 +264,9 @@ def get_minimum_set(gRNA_hits, manual_check = True, exclude_seqs = set(), target
         ## if valid set AND manual check requested
         else:
             ## print gRNA sequences in seq_set to screen for user to evaluate
-            gRNA_seq_set = sorted(gRNA_hits.get_gRNAseqs_by_seq(*seq_set), key = lambda gRNA_seq: gRNA_seq.id)
+            gRNA_seq_set = sorted(gRNA_hits.get_gRNAseqs_by_seq(*seq_set), key = attrgetter("id"))
+            id_seq_dict = {gRNA_seq.id: str(gRNA_seq.seq) for gRNA_seq in gRNA_seq_set}
+            upper_seq_dict = {seq.upper(): seq for seq in id_seq_dict.values()}
             print(f"\n\tID\tsequence (Set {set_num})")
             for gRNA_seq in gRNA_seq_set:
                 print(f"\t{gRNA_seq.id}\t{gRNA_seq.seq}")
@@ -251,11 +275,12 @@ def get_minimum_set(gRNA_hits, manual_check = True, exclude_seqs = set(), target
             if usr_input.upper() == 'X':
                 break
             else:
-                id_seq_dict = {gRNA_seq.id: gRNA_seq.seq for gRNA_seq in gRNA_seq_set}
+                ## note: exclude_seqs is rebound rather than updated in place so that
+                ##  neither the caller's set nor the default argument is modified
                 if usr_input in id_seq_dict:
-                    exclude_seqs |= {str(id_seq_dict[usr_input])}
-                elif usr_input.upper() in set(str(x).upper() for x in id_seq_dict.values()):
-                    exclude_seqs |= {usr_input}
+                    exclude_seqs = set(exclude_seqs) | {id_seq_dict[usr_input]}
+                elif usr_input.upper() in upper_seq_dict:
+                    exclude_seqs = set(exclude_seqs) | {upper_seq_dict[usr_input.upper()]}
                 else:
                     print("Invalid input.")
     return seq_set
@@ -268,14 +293,16 @@ def get_minimum_set(gRNA_hits, manual_check = True, exclude_seqs = set(), target
 
 ## note that tie_breaker function should work on dictionaries of {gRNA_seq: {gRNAHit objects}} and return a tuple or list of two values: (gRNA_seq, {gRNAHit objects})
 def set_cover(gRNA_hits, target_ids, algorithm = "LAR", exclude_seqs = set(),
-              id_key = lambda x: x, tie_breaker = tie_break_first, suppress_warning = False):
+              id_key = lambda x: x, tie_breaker = tie_break_first, suppress_warning = False,
+              history = None):
     """
     Execute set cover algorithm to generate minimum gRNA set.
     
     Arguments:
         gRNA_hits (list): gRNAHit objects
         target_ids (list): target IDs (str)
-        algorithm (str): set cover algorithm
+        algorithm (str): set cover algorithm ('LAR', 'greedy', 'bigstep2', or 'bigstep3',
+            where the number is the number of gRNA seqs chosen per step; 'bigstep' is equivalent to 'bigstep2')
         exclude_seqs (set/list): gRNA sequences (str) to exclude
         id_key (func): function to extract target ID from gRNAHit obj
         tie_breaker (func): tie-breaker function.
@@ -283,31 +310,186 @@ def set_cover(gRNA_hits, target_ids, algorithm = "LAR", exclude_seqs = set(),
             (2) unmodified 'gRNA_coverage',
             (3) list of IDs of targets covered by already selected gRNA
         suppress_warning (bool): suppress printing of warning when gRNA cannot cover all targets
+        history (list): optional, order in which gRNA sequences were selected by a previous run.
+            See :func:`~minorg.minimum_set.set_cover_LAR`.
     
     Returns
     -------
-    list
+    frozenset
         Minimum set of gRNA sequences (str)
     """
+    target_ids = frozenset(target_ids)
     exclude_seqs = set(str(s).upper() for s in exclude_seqs)
-    gRNA_coverage = {seq: hits for seq, hits in gRNA_hits.hits.items()
-                     if str(seq).upper() not in exclude_seqs}
+    if exclude_seqs:
+        upper_seqs = gRNA_hits.upper_seqs
+        gRNA_coverage = {seq: hits for seq, hits in gRNA_hits.hits.items()
+                         if upper_seqs[seq] not in exclude_seqs}
+    else:
+        gRNA_coverage = dict(gRNA_hits.hits)
+    set_cover_algorithms = {"LAR": set_cover_LAR, "greedy": set_cover_greedy}
+    ## 'bigstep' chooses 2 gRNA seqs per step, 'bigstep2' and 'bigstep3' choose 2 and 3 gRNA seqs per step
+    ## (larger numbers are not accepted as the number of combinations evaluated per step grows too quickly)
+    bigstep = re.fullmatch(r"bigstep([23])?", algorithm)
+    if bigstep:
+        set_cover_algorithms[algorithm] = functools.partial(set_cover_bigstep, p = int(bigstep.group(1) or 2))
+    elif algorithm not in set_cover_algorithms:
+        raise MINORgError(f"Invalid set cover algorithm: '{algorithm}'. "
+                          f"Valid algorithms: {', '.join(set_cover_algorithms)}, bigstep, bigstep2, bigstep3")
+    coverage_index = index_coverage(gRNA_coverage, id_key = id_key)
     ## check if set cover is possible before attempting to solve set cover
-    try:
-        if ( set(id_key(y) for x in gRNA_coverage.values() for y in x) & set(target_ids) ) < set(target_ids):
-            if not suppress_warning:
-                print("\nWARNING: The provided gRNA sequences cannot cover all target sequences.\n")
-        elif algorithm == "LAR":
-            return set_cover_LAR(gRNA_coverage, target_ids, id_key = id_key, tie_breaker = tie_breaker)
-        elif algorithm == "greedy":
-            return set_cover_greedy(gRNA_coverage, target_ids, id_key = id_key, tie_breaker = tie_breaker)
-    except Exception as e:
-        print(len(gRNA_coverage), len(target_ids))
-        raise e
-    return []
+    if not target_ids <= frozenset().union(*coverage_index[0].values()):
+        if not suppress_warning:
+            print("\nWARNING: The provided gRNA sequences cannot cover all target sequences.\n")
+        return frozenset()
+    return set_cover_algorithms[algorithm](gRNA_coverage, target_ids, id_key = id_key,
+                                           tie_breaker = tie_breaker, history = history,
+                                           coverage_index = coverage_index)
+
+def index_coverage(gRNA_coverage, id_key = lambda x: x):
+    """
+    Index IDs of targets covered by each gRNA sequence, and gRNA sequences covering each target.
+    
+    Arguments:
+        gRNA_coverage (dict): {'<gRNA seq>': [<list of gRNAHit obj associated w/ that gRNA seq>]}
+        id_key (func): function to extract target ID from gRNAHit obj
+    
+    Returns
+    -------
+    dict
+        Of {'<gRNA seq>': frozenset(<target IDs>)}
+    dict
+        Of {'<target ID>': {<set of gRNA seqs>}}
+    """
+    target_coverage = {seq: frozenset(id_key(hit) for hit in hits) for seq, hits in gRNA_coverage.items()}
+    target_to_seqs = defaultdict(set)
+    for seq, seq_targets in target_coverage.items():
+        for target_id in seq_targets:
+            target_to_seqs[target_id].add(seq)
+    return target_coverage, target_to_seqs
+
+def remove_redundant(result_cover):
+    """
+    Remove gRNA sequences whose targets are all covered by the other remaining gRNA sequences.
+    
+    gRNA sequences are assessed in order, such that a gRNA sequence is only removed
+    if its targets are covered by gRNA sequences that have not already been removed.
+    
+    Arguments:
+        result_cover (dict): {'<gRNA seq>': {<set of IDs of all targets covered by gRNA seq>}}, modified in place
+    
+    Returns
+    -------
+    dict
+        Of {'<gRNA seq>': {<set of target IDs>}}
+    """
+    ## note: counts are updated as gRNA seqs are removed. Testing each gRNA seq against the union of
+    ##  all others (e.g. using prefix/suffix unions) could remove two gRNA seqs that only cover each other.
+    ## number of remaining gRNA seqs covering each target
+    target_count = Counter(itertools.chain(*result_cover.values()))
+    for seq_id in list(result_cover):
+        coverage = result_cover[seq_id]
+        if all(target_count[target_id] > 1 for target_id in coverage):
+            target_count.subtract(coverage)
+            del result_cover[seq_id]
+    return result_cover
+
+class CoverageHeap:
+    """
+    Max-heap of gRNA sequences by number of targets they cover that are not yet covered.
+    
+    Heap entries are not updated when counts change. Instead, entries whose counts no
+    longer match are discarded when they reach the top of the heap, and gRNA sequences
+    whose counts have changed should be pushed again using :meth:`~minorg.minimum_set.CoverageHeap.push`.
+    
+    Attributes:
+        _counts (dict): number of uncovered targets of each gRNA sequence
+            (format: {'<gRNA seq>': <count>}), updated by the caller
+        _index (dict): position of each gRNA sequence in original order (format: {'<gRNA seq>': <index>}),
+            used to order gRNA sequences with equal counts
+        _heap (list): heap of (-<count>, <index>, '<gRNA seq>')
+    """
+    def __init__(self, counts):
+        """
+        Create a CoverageHeap object.
+        
+        Arguments:
+            counts (dict): number of uncovered targets of each gRNA sequence (format: {'<gRNA seq>': <count>})
+        """
+        self._counts = counts
+        self._index = {seq: i for i, seq in enumerate(counts)}
+        self._heap = [(-count, i, seq) for i, (seq, count) in enumerate(counts.items())]
+        heapq.heapify(self._heap)
+    def push(self, *seqs) -> None:
+        """
+        Add (or re-add) gRNA sequences to heap using their current counts.
+        
+        Arguments:
+            *seqs (str): gRNA sequences
+        """
+        for seq in seqs:
+            heapq.heappush(self._heap, (-self._counts[seq], self._index[seq], seq))
+        return
+    def pop_max(self) -> tuple:
+        """
+        Remove all gRNA sequences with the largest non-zero count from heap.
+        
+        gRNA sequences that are popped but not chosen should be re-added
+        using :meth:`~minorg.minimum_set.CoverageHeap.push`.
+        
+        Returns
+        -------
+        int
+            Largest count (0 if no gRNA sequence covers any uncovered target)
+        list
+            Of gRNA sequences (str) with largest count, in original order
+        """
+        max_val, max_seqs = 0, []
+        while self._heap:
+            count, i, seq = self._heap[0]
+            if -count != self._counts[seq]: ## outdated entry
+                heapq.heappop(self._heap)
+            elif -count == 0 or (max_seqs and -count < max_val):
+                break
+            else:
+                heapq.heappop(self._heap)
+                max_val = -count
+                max_seqs.append(seq)
+        return max_val, max_seqs
+
+def cover_seq(seq, target_coverage, target_to_seqs, uncovered_count, covered):
+    """
+    Select a gRNA sequence: mark its targets as covered and update the counts of other gRNA sequences.
+    
+    Arguments:
+        seq (str): gRNA sequence
+        target_coverage (dict): {'<gRNA seq>': frozenset(<target IDs>)},
+            see :func:`~minorg.minimum_set.index_coverage`
+        target_to_seqs (dict): {'<target ID>': {<set of gRNA seqs>}},
+            see :func:`~minorg.minimum_set.index_coverage`
+        uncovered_count (dict): number of targets covered by each gRNA sequence that are not yet covered
+            (format: {'<gRNA seq>': <count>}), modified in place
+        covered (set): IDs of targets already covered, modified in place
+    
+    Returns
+    -------
+    frozenset
+        Of IDs of targets newly covered by ``seq``
+    set
+        Of gRNA sequences (str) other than ``seq`` whose counts were updated
+    """
+    coverage = target_coverage[seq] - covered
+    covered.update(coverage)
+    updated = set()
+    for target_id in coverage:
+        for other_seq in target_to_seqs[target_id]:
+            uncovered_count[other_seq] -= 1
+            updated.add(other_seq)
+    updated.discard(seq)
+    return coverage, updated
 
 ## LAR algorithm
-def set_cover_LAR(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breaker = tie_break_first):
+def set_cover_LAR(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breaker = tie_break_first,
+                  history = None, coverage_index = None):
     """
     Set cover algorithm LAR.
     
@@ -321,39 +503,61 @@ def set_cover_LAR(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breaker =
             Takes (1) 'gRNA_coverage' filtered for unselected gRNA seq,
             (2) unmodified 'gRNA_coverage',
             (3) list of IDs of targets covered by already selected gRNA
+        history (list): optional, gRNA sequences in the order they were selected by a previous run
+            with the same arguments, except for additional gRNA sequences removed from 'gRNA_coverage'.
+            gRNA sequences up to the first one no longer in 'gRNA_coverage' are re-selected without
+            re-solving, after which the list is updated in place with this run's order of selection.
+            The result is the same as without 'history' so long as the tie breaker's choice
+            is unaffected by removal of other tied gRNA sequences (true of the tie breakers in this module).
+        coverage_index (tuple): optional, output of :func:`~minorg.minimum_set.index_coverage`
+            for 'gRNA_coverage' and 'id_key'. Computed if not provided.
     
     Returns
     -------
-    set
+    frozenset
         Minimum set of gRNA sequences (str)
     """
-    main_sorting_key = lambda k, uncovered_count: len(set(id_key(x) for x in uncovered_count[k]))
+    ## result_cover stores all targets covered by each chosen gRNA seq (not only those newly covered)
+    ##  so that remove_redundant can detect chosen seqs made redundant by seqs chosen after them
     result_cover, covered = {}, set()
-    from copy import deepcopy
-    uncovered_count = deepcopy(gRNA_coverage)
+    if coverage_index is None: coverage_index = index_coverage(gRNA_coverage, id_key = id_key)
+    target_coverage, target_to_seqs = coverage_index
+    ## target ID of each hit, so that id_key is only called once per hit
+    hit_ids = {seq: [(id_key(hit), hit) for hit in hits] for seq, hits in gRNA_coverage.items()}
+    ## number of targets covered by each gRNA seq that are not yet covered by chosen seqs
+    uncovered_count = {seq: len(seq_targets) for seq, seq_targets in target_coverage.items()}
+    heap = CoverageHeap(uncovered_count)
+    ## re-select gRNA seqs selected by a previous run, up to the first one that is no longer a candidate
+    history = [] if history is None else history
+    for i, seq in enumerate(history):
+        if seq not in gRNA_coverage:
+            del history[i:]
+            break
+        updated = cover_seq(seq, target_coverage, target_to_seqs, uncovered_count, covered)[1]
+        result_cover[seq] = target_coverage[seq]
+        heap.push(*updated)
     ## get set cover
-    while {len(v) for v in uncovered_count.values()} != {0}:
-        sorting_key = lambda k: main_sorting_key(k, uncovered_count)
-        max_val = sorting_key(max(uncovered_count, key = sorting_key))
-        max_items = {seq: hits for seq, hits in uncovered_count.items()
-                     if sorting_key(seq) == max_val}
-        seq, coverage = tie_breaker(max_items, gRNA_coverage, covered)
-        coverage = set(id_key(target) for target in coverage)
-        covered |= coverage
-        result_cover[seq] = coverage
-        ## update coverage of unchosen seqs
-        uncovered_count = {seq: set(hit for hit in hits if id_key(hit) not in covered)
-                           for seq, hits in uncovered_count.items()}
+    max_val, max_seqs = heap.pop_max()
+    while max_val:
+        max_items = {seq: [hit for target_id, hit in hit_ids[seq] if target_id not in covered]
+                     for seq in max_seqs}
+        seq = tie_breaker(max_items, gRNA_coverage, covered)[0]
+        updated = cover_seq(seq, target_coverage, target_to_seqs, uncovered_count, covered)[1]
+        result_cover[seq] = target_coverage[seq]
+        history.append(seq)
+        ## return unchosen tied seqs and seqs with updated coverage to heap
+        updated.update(max_seqs)
+        updated.discard(seq)
+        heap.push(*updated)
+        max_val, max_seqs = heap.pop_max()
     ## remove redundant sequences
-    for seq_id, coverage in result_cover.items():
-        coverage_remaining = set().union(*[v for k, v in result_cover.items() if k != seq_id])
-        if coverage.issubset(coverage_remaining):
-            del result_cover[seq_id]
-    return set(result_cover.keys())
+    remove_redundant(result_cover)
+    return frozenset(result_cover)
 
 
 ## greedy algorithm
-def set_cover_greedy(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breaker = tie_break_first):
+def set_cover_greedy(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breaker = tie_break_first,
+                     history = None, coverage_index = None):
     """
     Greedy set cover algorithm.
     
@@ -365,20 +569,134 @@ def set_cover_greedy(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breake
             Takes (1) 'gRNA_coverage' filtered for unselected gRNA seq,
             (2) unmodified 'gRNA_coverage',
             (3) list of IDs of targets covered by already selected gRNA
+        history (list): optional, gRNA sequences in the order they were selected by a previous run
+            with the same arguments, except for additional gRNA sequences removed from 'gRNA_coverage'.
+            gRNA sequences up to the first one no longer in 'gRNA_coverage' are re-selected without
+            re-solving, after which the list is updated in place with this run's order of selection.
+            The result is the same as without 'history' so long as the tie breaker's choice
+            is unaffected by removal of other tied gRNA sequences (true of the tie breakers in this module).
+        coverage_index (tuple): optional, output of :func:`~minorg.minimum_set.index_coverage`
+            for 'gRNA_coverage' and 'id_key'. Computed if not provided.
     
     Returns
     -------
-    set
-        Minimum set of gRNA sequences (str)
+    frozenset
+        Minimum set of gRNA sequences (str), or empty if not all targets can be covered
     """
-    main_sorting_key = lambda k, covered: len(set(id_key(x) for x in gRNA_coverage[k]) - set(covered))
-    coverage_set = lambda k: set(id_key(x) for x in gRNA_coverage[k])
-    covered, desired = set(), []
-    while set(covered) != set(target_ids):
-        sorting_key = lambda k: main_sorting_key(k, covered)
-        max_val = sorting_key(max(gRNA_coverage, key = sorting_key))
-        max_items = {k: v for k, v in gRNA_coverage.items() if sorting_key(k) == max_val}
+    if coverage_index is None: coverage_index = index_coverage(gRNA_coverage, id_key = id_key)
+    target_coverage, target_to_seqs = coverage_index
+    ## number of targets covered by each gRNA seq that are not yet covered by chosen seqs
+    uncovered_count = {seq: len(seq_targets) for seq, seq_targets in target_coverage.items()}
+    heap = CoverageHeap(uncovered_count)
+    target_ids = frozenset(target_ids)
+    covered = set()
+    ## number of target_ids not yet covered by chosen seqs
+    remaining = len(target_ids)
+    ## re-select gRNA seqs selected by a previous run, up to the first one that is no longer a candidate
+    history = [] if history is None else history
+    for i, subset in enumerate(history):
+        if subset not in gRNA_coverage:
+            del history[i:]
+            break
+        coverage, updated = cover_seq(subset, target_coverage, target_to_seqs, uncovered_count, covered)
+        remaining -= len(target_ids.intersection(coverage))
+        heap.push(*updated)
+    while remaining:
+        max_val, max_seqs = heap.pop_max()
+        ## remaining targets cannot be covered by any gRNA seq
+        if max_val == 0: break
+        max_items = {k: gRNA_coverage[k] for k in max_seqs}
         subset = tie_breaker(max_items, gRNA_coverage, covered)[0]
-        covered |= coverage_set(subset)
-        desired.append(subset)
-    return set(desired)
+        coverage, updated = cover_seq(subset, target_coverage, target_to_seqs, uncovered_count, covered)
+        remaining -= len(target_ids.intersection(coverage))
+        history.append(subset)
+        ## return unchosen tied seqs and seqs with updated coverage to heap
+        updated.update(max_seqs)
+        updated.discard(subset)
+        heap.push(*updated)
+    ## targets could not all be covered
+    if remaining: return frozenset()
+    return frozenset(history)
+
+
+## big step greedy algorithm
+def set_cover_bigstep(gRNA_coverage, target_ids, id_key = lambda x: x, tie_breaker = tie_break_first,
+                      history = None, coverage_index = None, p = 2):
+    """
+    Big step greedy set cover algorithm.
+    
+    At each step, the combination of 'p' gRNA sequences that together cover the most uncovered targets
+    is chosen, instead of a single gRNA sequence as in the greedy algorithm. This can yield smaller
+    sets than the greedy algorithm for some inputs (but not all), at the cost of evaluating all
+    combinations of 'p' gRNA sequences that still cover uncovered targets at each step
+    (hence 'p' is limited to 3).
+    
+    Arguments:
+        gRNA_coverage (dict): {'<gRNA seq>': [<list of gRNAHit obj associated w/ that gRNA seq>]}
+        target_ids (list): IDs of targets to cover
+        id_key (func): function to extract target ID from gRNAHit obj
+        tie_breaker (func): tie-breaker function, used to choose between combinations with
+            equivalent coverage by choosing one of their gRNA sequences.
+            Takes (1) 'gRNA_coverage' filtered for unselected gRNA seq,
+            (2) unmodified 'gRNA_coverage',
+            (3) list of IDs of targets covered by already selected gRNA
+        history (list): optional, updated in place with the order in which gRNA sequences were selected.
+            Unlike :func:`~minorg.minimum_set.set_cover_greedy`, it is not used to resume a previous run.
+        coverage_index (tuple): optional, output of :func:`~minorg.minimum_set.index_coverage`
+            for 'gRNA_coverage' and 'id_key'. Computed if not provided.
+        p (int): number of gRNA sequences to choose at each step (1 to 3)
+    
+    Returns
+    -------
+    frozenset
+        Minimum set of gRNA sequences (str), or empty if not all targets can be covered
+    """
+    if not 1 <= p <= 3:
+        raise MINORgError(f"Invalid number of gRNA sequences to choose at each step: {p}. Must be 1, 2, or 3.")
+    target_ids = frozenset(target_ids)
+    result_cover, covered = {}, set()
+    if coverage_index is None: coverage_index = index_coverage(gRNA_coverage, id_key = id_key)
+    target_coverage, target_to_seqs = coverage_index
+    ## targets in target_ids covered by each gRNA seq that are not yet covered by chosen seqs
+    uncovered = {seq: set(seq_targets & target_ids) for seq, seq_targets in target_coverage.items()}
+    history = [] if history is None else history
+    del history[:]
+    while len(covered) < len(target_ids):
+        candidates = [seq for seq, seq_targets in uncovered.items() if seq_targets]
+        ## remaining targets cannot be covered by any gRNA seq
+        if not candidates: break
+        ## get all combinations with the most uncovered targets
+        best_val, best_combos = 0, []
+        for combo in itertools.combinations(candidates, min(p, len(candidates))):
+            ## skip combinations that cannot match the best combination so far
+            if sum(len(uncovered[seq]) for seq in combo) < best_val: continue
+            val = len(set().union(*(uncovered[seq] for seq in combo)))
+            if val > best_val:
+                best_val, best_combos = val, [combo]
+            elif val == best_val:
+                best_combos.append(combo)
+        ## break ties using the first combination that includes the tie breaker's choice of gRNA seq
+        if len(best_combos) > 1:
+            max_items = {seq: [hit for hit in gRNA_coverage[seq] if id_key(hit) not in covered]
+                         for seq in dict.fromkeys(itertools.chain(*best_combos))}
+            chosen = tie_breaker(max_items, gRNA_coverage, covered)[0]
+            best_combo = next(combo for combo in best_combos if chosen in combo)
+        else:
+            best_combo = best_combos[0]
+        ## add gRNA seqs in combination that cover targets not covered by earlier gRNA seqs in combination
+        for seq in best_combo:
+            coverage = frozenset(uncovered.pop(seq))
+            if not coverage: continue
+            ## store all targets covered so that remove_redundant can detect seqs superseded by later picks
+            result_cover[seq] = target_coverage[seq] & target_ids
+            covered.update(coverage)
+            history.append(seq)
+            for target_id in coverage:
+                for other_seq in target_to_seqs[target_id]:
+                    if other_seq in uncovered:
+                        uncovered[other_seq].discard(target_id)
+    ## targets could not all be covered
+    if len(covered) < len(target_ids): return frozenset()
+    ## remove redundant sequences
+    remove_redundant(result_cover)
+    return frozenset(result_cover)
@@ -0,0 +1,87 @@
+import random
+import unittest
+from collections import namedtuple
+from operator import attrgetter
+
+from minorg import MINORgError
+from minorg.grna import gRNAHits
+from minorg.minimum_set import (remove_redundant, set_cover, set_cover_LAR, set_cover_bigstep,
+                                all_best_nr, all_best_pos, tie_break_first)
+
+## coverage is given as {'<gRNA seq>': [<target IDs>]} with the default id_key (lambda x: x)
+
+class TestRemoveRedundant(unittest.TestCase):
+    def test_overlapping_coverage(self):
+        result_cover = {'a': {1, 2}, 'b': {2, 3}, 'c': {1, 3}}
+        self.assertEqual(set(remove_redundant(result_cover)), {'b', 'c'})
+    def test_disjoint_coverage(self):
+        result_cover = {'a': {1}, 'b': {2, 3}}
+        self.assertEqual(set(remove_redundant(result_cover)), {'a', 'b'})
+
+class TestSetCoverLAR(unittest.TestCase):
+    def test_drops_seq_superseded_by_later_picks(self):
+        ## 'a' is chosen first, but 'b' and 'c' (chosen after) cover all of its targets
+        gRNA_coverage = {'a': [1, 2, 5], 'b': [2, 3, 5], 'c': [1, 2, 4], 'd': [2, 3]}
+        history = []
+        result = set_cover_LAR(gRNA_coverage, {1, 2, 3, 4, 5}, history = history)
+        self.assertEqual(history, ['a', 'b', 'c'])
+        self.assertEqual(result, frozenset({'b', 'c'}))
+
+class TestSetCoverBigstep(unittest.TestCase):
+    def test_drops_seq_superseded_by_later_picks(self):
+        ## 'a' and 'c' are chosen together, but 'c' covers all of the targets of 'a'
+        gRNA_coverage = {'a': [1, 6], 'b': [5], 'c': [1, 3, 5, 6], 'd': [1, 3]}
+        history = []
+        result = set_cover_bigstep(gRNA_coverage, {1, 3, 5, 6}, p = 2, history = history)
+        self.assertEqual(history, ['a', 'c'])
+        self.assertEqual(result, frozenset({'c'}))
+    def test_overlapping_coverage(self):
+        gRNA_coverage = {'a': [1, 2], 'b': [2, 3], 'c': [1, 3]}
+        self.assertEqual(set_cover_bigstep(gRNA_coverage, {1, 2, 3}, p = 2), frozenset({'a', 'b'}))
+    def test_single_seq_per_step(self):
+        gRNA_coverage = {'a': [1, 2, 3], 'b': [1, 4], 'c': [2, 3, 5]}
+        ## 'a' is chosen first, then 'b' and 'c', which together cover all of the targets of 'a'
+        self.assertEqual(set_cover_bigstep(gRNA_coverage, {1, 2, 3, 4, 5}, p = 1), frozenset({'b', 'c'}))
+    def test_unreachable_targets(self):
+        self.assertEqual(set_cover_bigstep({'a': [1], 'b': [2]}, {1, 2, 3}, p = 2), frozenset())
+    def test_p_limit(self):
+        with self.assertRaises(MINORgError):
+            set_cover_bigstep({'a': [1], 'b': [2]}, {1, 2}, p = 4)
+
+## minimal stand-in for gRNAHit with the attributes used by set cover and tie breakers
+Hit = namedtuple("Hit", ["target_id", "proximity"])
+
+def tie_break_pos_nr(cov, all_cov, covered):
+    return next(iter(all_best_nr(all_best_pos(cov, all_cov, covered), all_cov, covered).items()))
+
+def tie_break_nr_pos(cov, all_cov, covered):
+    return next(iter(all_best_pos(all_best_nr(cov, all_cov, covered), all_cov, covered).items()))
+
+class TestSetCoverHistory(unittest.TestCase):
+    def make_gRNA_hits(self, rng):
+        targets = [f"t{i}" for i in range(rng.randint(2, 12))]
+        hits = {}
+        for i in range(rng.randint(2, 20)):
+            seq_targets = rng.sample(targets, rng.randint(1, min(4, len(targets))))
+            hits[f"SEQ{i:02d}"] = [Hit(target_id, rng.randint(0, 3)) for target_id in seq_targets]
+        return gRNAHits(gRNA_hits = hits)
+    def test_resume_matches_fresh_solve(self):
+        ## excluding a selected seq and resuming from history should give the same set as solving again
+        rng = random.Random(0)
+        for _ in range(200):
+            gRNA_hits = self.make_gRNA_hits(rng)
+            for algorithm in ("LAR", "greedy"):
+                for tie_breaker in (tie_break_first, tie_break_pos_nr, tie_break_nr_pos):
+                    kwargs = dict(algorithm = algorithm, id_key = attrgetter("target_id"),
+                                  tie_breaker = tie_breaker, suppress_warning = True)
+                    history = []
+                    seq_set = set_cover(gRNA_hits, gRNA_hits.target_ids, history = history, **kwargs)
+                    if not seq_set: continue
+                    exclude_seqs = {rng.choice(sorted(seq_set))}
+                    self.assertEqual(set_cover(gRNA_hits, gRNA_hits.target_ids, exclude_seqs = exclude_seqs,
+                                               history = history, **kwargs),
+                                     set_cover(gRNA_hits, gRNA_hits.target_ids, exclude_seqs = exclude_seqs,
+                                               **kwargs))
+
+if __name__ == "__main__":
+    unittest.main()